@@ -1,13 +1,55 @@
-import base58
+try:
+    # Rust implementation, installed with the "fast" extra.
+    import based58 as base58
+except ImportError:
+    import base58
 import json
 import itertools
+import logging
+import msgspec
+import orjson
+import os
+import threading
+import time
+from typing import Optional, Tuple
 
 import near_api
+from concurrent.futures import ThreadPoolExecutor
 from near_api import transactions
+from near_api.providers import WaitUntil
+
+log = logging.getLogger(__name__)
 
 # Amount of gas attached by default 1e14.
 DEFAULT_ATTACHED_GAS = 100_000_000_000_000
 
+# How long (in seconds) a fetched block hash is reused for signing transactions.
+BLOCK_HASH_TTL = 0.5
+
+# Transaction errors after which the cached block hash must not be reused.
+STALE_BLOCK_HASH_ERRORS = ('InvalidNonce', 'Expired')
+
+# Polling schedule (in seconds) for a transaction the node timed out waiting on: the delay doubles up to the cap.
+TX_POLL_INITIAL_DELAY = 0.2
+TX_POLL_MAX_DELAY = 3.2
+TX_POLL_TIMEOUT = 60.0
+
+
+def _encode_args(args) -> bytes:
+    """JSON-encodes contract call args; already encoded bytes-like args are passed through unchanged."""
+    if isinstance(args, (bytes, bytearray, memoryview)):
+        return bytes(args)
+    try:
+        return orjson.dumps(args)
+    except orjson.JSONEncodeError:
+        # orjson refuses integers wider than 64 bits, fall back to the stdlib encoder for those.
+        return json.dumps(args).encode('utf8')
+
+
+def _decode_result(data: bytes):
+    # msgspec keeps integers wider than 64 bits exact, where orjson would turn them into floats.
+    return msgspec.json.decode(data)
+
 
 class TransactionError(Exception):
     pass
@@ -17,60 +59,276 @@ class ViewFunctionError(Exception):
     pass
 
 
+class SubmitManyError(TransactionError):
+    """Raised by submit_many when a broadcast fails; tx_hashes lists the transactions already sent."""
+
+    def __init__(self, error, tx_hashes: list):
+        super().__init__(error)
+        self.tx_hashes = tx_hashes
+
+
+_sign_pool: Optional[ThreadPoolExecutor] = None
+_sign_pool_lock = threading.Lock()
+
+
+def _get_sign_pool() -> ThreadPoolExecutor:
+    """Thread pool shared by all accounts for signing in submit_many, created on first use."""
+    global _sign_pool
+    with _sign_pool_lock:
+        if _sign_pool is None:
+            _sign_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        return _sign_pool
+
+
+def _async_variant(method):
+    """
+    Builds the *_async twin of an Account method: the same transaction is sent
+    with wait_until=WaitUntil.NONE, so the call returns the tx_hash without waiting.
+    https://docs.near.org/docs/api/rpc/transactions#send-transaction-async
+    """
+    name = method.__name__ + '_async'
+
+    def wrapper(self, *args, **kwargs) -> str:
+        if 'wait_until' in kwargs:
+            raise TypeError(f"{name}() does not accept wait_until, call {method.__name__}() instead")
+        return method(self, *args, wait_until=WaitUntil.NONE, **kwargs)
+    wrapper.__name__ = name
+    wrapper.__qualname__ = method.__qualname__ + '_async'
+    wrapper.__doc__ = f"Same as {method.__name__}(), but returns the tx_hash as soon as the transaction is broadcast."
+    return wrapper
+
+
+class ActionBatch(object):
+    """
+    Collects actions for a single receiver and submits them as one signed transaction.
+
+    Usage:
+        with account.batch(contract_id) as batch:
+            batch.deploy(contract_code)
+            batch.function_call("new", {"owner_id": account.account_id})
+        batch.result
+    """
+
+    def __init__(self, account: 'Account', receiver_id: str, wait_until: str = WaitUntil.EXECUTED_OPTIMISTIC):
+        self._account = account
+        self._receiver_id = receiver_id
+        self._wait_until = wait_until
+        self._actions = []
+        self.result = None
+
+    def __enter__(self) -> 'ActionBatch':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None and self._actions:
+            self.result = self._send()
+
+    @property
+    def receiver_id(self) -> str:
+        return self._receiver_id
+
+    @property
+    def actions(self) -> list:
+        return self._actions
+
+    def add(self, action: 'transactions.Action'):
+        self._actions.append(action)
+
+    def create_account(self):
+        self.add(transactions.create_create_account_action())
+
+    def transfer(self, amount: int):
+        self.add(transactions.create_transfer_action(amount))
+
+    def function_call(self, method_name, args, gas=DEFAULT_ATTACHED_GAS, amount=0):
+        args = _encode_args(args)
+        self.add(transactions.create_function_call_action(method_name, args, gas, amount))
+
+    def deploy(self, contract_code):
+        self.add(transactions.create_deploy_contract_action(contract_code))
+
+    def add_full_access_key(self, public_key):
+        self.add(transactions.create_full_access_key_action(public_key))
+
+    def delete_access_key(self, public_key):
+        self.add(transactions.create_delete_access_key_action(public_key))
+
+    def _send(self):
+        return self._account._submit(self._receiver_id, self._actions, wait_until=self._wait_until)
+
+
 class Account(object):
 
     def __init__(
             self,
             provider: 'near_api.providers.JsonProvider',
             signer: 'near_api.signer.Signer',
-            account_id: str
+            account_id: str,
+            initial_nonce: Optional[int] = None
     ):
+        '''
+        Account state and access key are fetched lazily, on first use.
+        If the current nonce of the signer's access key is already known, pass it as
+        initial_nonce to skip the access key lookup entirely.
+        '''
         self._provider = provider
         self._signer = signer
         self._account_id = account_id
-        self._account: dict = provider.get_account(account_id)
-        self._access_key: dict = provider.get_access_key(account_id, self._signer.key_pair.encoded_public_key())
-
-    def _sign_and_submit_tx(self, receiver_id: str, actions) -> dict:
-        self._access_key["nonce"] += 1
-        block_hash = self._provider.get_status()['sync_info']['latest_block_hash']
-        block_hash = base58.b58decode(block_hash.encode('utf8'))
-        serialized_tx = transactions.sign_and_serialize_transaction(
-            receiver_id, self._access_key["nonce"], actions, block_hash, self._signer)
-        result: dict = self._provider.send_tx_and_wait(serialized_tx, 10)
-        for outcome in itertools.chain([result['transaction_outcome']], result['receipts_outcome']):
-            for log in outcome['outcome']['logs']:
-                print("Log:", log, flush=True)
-        if 'Failure' in result['status']:
-            raise TransactionError(result['status']['Failure'])
-        return result
-    
-    def _sign_and_submit_tx_async(self, receiver_id: str, actions) -> str:
+        self._account: dict = None
+        self._access_key: dict = None if initial_nonce is None else {"nonce": initial_nonce}
+        self._next_nonce: Optional[int] = None if initial_nonce is None else initial_nonce + 1
+        # (block hash, time.monotonic() when fetched), replaced as a whole so concurrent submitters see a consistent pair.
+        self._cached_block_hash: Optional[Tuple[bytes, float]] = None
+        self._tx_template_cache = {}
+        self._nonce_lock = threading.Lock()
+
+    def _fetch_access_key(self):
+        self._access_key = self._provider.get_access_key(self._account_id, self._signer.encoded_public_key())
+
+    def reserve_nonce(self, n: int = 1) -> range:
+        """
+        Hands out the next n nonces of the signer's access key as a contiguous range.
+
+        Safe to call from concurrent submitters: each nonce is handed out only once.
+        """
+        with self._nonce_lock:
+            if self._next_nonce is None:
+                if self._access_key is None:
+                    self._fetch_access_key()
+                self._next_nonce = self._access_key["nonce"] + 1
+            nonces = range(self._next_nonce, self._next_nonce + n)
+            self._next_nonce += n
+            self._access_key["nonce"] = self._next_nonce - 1
+            return nonces
+
+    def _refresh_access_key(self):
+        """Resyncs the local nonce counter with the node, e.g. after another client used the same key."""
+        access_key = self._provider.get_access_key(self._account_id, self._signer.encoded_public_key())
+        with self._nonce_lock:
+            self._next_nonce = max(self._next_nonce or 0, access_key["nonce"] + 1)
+            access_key["nonce"] = self._next_nonce - 1
+            self._access_key = access_key
+
+    def _recent_block_hash(self) -> bytes:
+        """Latest block hash, reused for BLOCK_HASH_TTL seconds to skip a status round-trip per tx."""
+        cached = self._cached_block_hash
+        if cached is not None and time.monotonic() - cached[1] < BLOCK_HASH_TTL:
+            return cached[0]
+        block_hash = base58.b58decode(self._provider.get_latest_block_hash().encode('utf8'))
+        self._tx_template_cache.clear()
+        self._cached_block_hash = (block_hash, time.monotonic())
+        return block_hash
+
+    def _tx_template(self, receiver_id: str, block_hash: bytes) -> 'transactions.TransactionTemplate':
+        """Serialized transaction parts for receiver_id, reused until the block hash changes."""
+        key = (receiver_id, block_hash)
+        template = self._tx_template_cache.get(key)
+        if template is None:
+            template = transactions.build_template(self._signer, receiver_id, block_hash)
+            self._tx_template_cache[key] = template
+        return template
+
+    def _on_tx_error(self, error):
+        error = str(error)
+        if any(kind in error for kind in STALE_BLOCK_HASH_ERRORS):
+            self._cached_block_hash = None
+        if 'InvalidNonce' in error:
+            self._refresh_access_key()
+
+    def _await_outcome(self, tx_hash: str, wait_until: str) -> dict:
+        """Re-queries the tx status with exponential backoff while the node keeps timing out."""
+        delay = TX_POLL_INITIAL_DELAY
+        deadline = time.monotonic() + TX_POLL_TIMEOUT
+        while True:
+            try:
+                return self._provider.get_tx_status(tx_hash, self._account_id, wait_until)
+            except near_api.providers.JsonProviderError as e:
+                if 'TIMEOUT_ERROR' not in str(e):
+                    raise
+            if time.monotonic() >= deadline:
+                raise TransactionError(f'Transaction {tx_hash} did not reach {wait_until} in {TX_POLL_TIMEOUT}s')
+            time.sleep(delay)
+            delay = min(delay * 2, TX_POLL_MAX_DELAY)
+
+    def _send_and_wait(self, serialized_tx: bytes, wait_until: str) -> dict:
+        try:
+            return self._provider.send_tx_until(serialized_tx, wait_until)
+        except near_api.providers.JsonProviderError as e:
+            # Any other error means the transaction was rejected, e.g. InvalidNonce or Expired.
+            if 'TIMEOUT_ERROR' not in str(e):
+                raise
+        tx_hash = base58.b58encode(transactions.signed_transaction_hash(serialized_tx)).decode('utf8')
+        return self._await_outcome(tx_hash, wait_until)
+
+    def _submit(self, receiver_id: str, actions, *, wait_until: str = WaitUntil.EXECUTED_OPTIMISTIC):
         """
-        _sign_and_submit_tx_async
-        
-        sending in async not await method
-        result gives a tx_hash to look at explorer
-        https://docs.near.org/docs/api/rpc/transactions#send-transaction-async
+        Signs and broadcasts a transaction, then waits for it according to wait_until.
+        Every transaction sent by Account goes through here.
+
+        The nonce is reserved under a lock and the network calls happen outside of it,
+        so several transactions can be submitted concurrently.
 
         Args:
             receiver_id (str): account name receiving transaction results
-            actions (_type_): list of transaction actions
+            actions (list): list of transaction actions
+            wait_until (str): one of WaitUntil
 
         Returns:
-            str: tx_hash of transaction
+            str: tx_hash of transaction if wait_until is WaitUntil.NONE
+            dict: send_tx response otherwise; with WaitUntil.INCLUDED it may hold only final_execution_status
         """
-        self._access_key["nonce"] += 1
-        block_hash = self._provider.get_status()['sync_info']['latest_block_hash']
-        block_hash = base58.b58decode(block_hash.encode('utf8'))
-        serialized_tx = transactions.sign_and_serialize_transaction(
-            receiver_id, self._access_key["nonce"], actions, block_hash, self._signer)
-        result = self._provider.send_tx(serialized_tx)
-        if (len(result) == 44):
-            # ok test for now, bc tx_hash is 44 chars long
-            raise TransactionError(f'Unable to sign and submit transaction. tx_hash is "{result}"')
+        nonce = self.reserve_nonce()[0]
+        template = self._tx_template(receiver_id, self._recent_block_hash())
+        serialized_tx = transactions.sign_and_serialize_from_template(template, nonce, actions, self._signer)
+        try:
+            if wait_until == WaitUntil.NONE:
+                return self._provider.send_tx(serialized_tx)
+            result = self._send_and_wait(serialized_tx, wait_until)
+        except near_api.providers.JsonProviderError as e:
+            self._on_tx_error(e)
+            raise
+        if 'receipts_outcome' in result and log.isEnabledFor(logging.INFO):
+            logs = ["Log: %s" % entry
+                    for outcome in itertools.chain([result['transaction_outcome']], result['receipts_outcome'])
+                    for entry in outcome['outcome']['logs']]
+            if logs:
+                log.info("\n".join(logs))
+        if isinstance(result.get('status'), dict) and 'Failure' in result['status']:
+            self._on_tx_error(result['status']['Failure'])
+            raise TransactionError(result['status']['Failure'])
         return result
 
+    def submit_many(self, receiver_id: str, actions_list: list) -> list:
+        """
+        Signs one transaction per entry of actions_list and broadcasts them in nonce order.
+
+        Nonces are reserved as one contiguous range. Signing runs on a shared thread pool;
+        only the libsodium part releases the GIL, Borsh serialization of the actions does not.
+        Does not wait for execution, like the *_async methods.
+
+        Raises:
+            SubmitManyError: a broadcast failed, the error carries the tx_hash of every transaction sent before it
+
+        Returns:
+            list: tx_hash of every transaction, in actions_list order
+        """
+        if not actions_list:
+            return []
+        nonces = self.reserve_nonce(len(actions_list))
+        template = self._tx_template(receiver_id, self._recent_block_hash())
+        serialized_txs = _get_sign_pool().map(
+            lambda nonce, actions: transactions.sign_and_serialize_from_template(
+                template, nonce, actions, self._signer),
+            nonces, actions_list)
+        tx_hashes = []
+        for serialized_tx in serialized_txs:
+            try:
+                tx_hashes.append(self._provider.send_tx(serialized_tx))
+            except near_api.providers.JsonProviderError as e:
+                self._on_tx_error(e)
+                raise SubmitManyError(e, tx_hashes) from e
+        return tx_hashes
+
     @property
     def account_id(self) -> str:
         return self._account_id
@@ -85,140 +343,120 @@ class Account(object):
 
     @property
     def access_key(self) -> dict:
+        if self._access_key is None:
+            with self._nonce_lock:
+                if self._access_key is None:
+                    self._fetch_access_key()
         return self._access_key
 
     @property
     def state(self) -> dict:
+        if self._account is None:
+            self.fetch_state()
         return self._account
 
     def fetch_state(self):
         """Fetch state for given account."""
         self._account = self.provider.get_account(self.account_id)
 
-    def send_money(self, account_id: str, amount: int) -> str:
+    def send_money(self, account_id: str, amount: int, *, wait_until: str = WaitUntil.EXECUTED_OPTIMISTIC):
         """Sends funds to given account_id given amount."""
-        return self._sign_and_submit_tx(account_id, [transactions.create_transfer_action(amount)])
-    
-    def send_money_async(self, account_id: str, amount: int) -> str:
-        """Sends funds to given account_id given amount."""
-        return self._sign_and_submit_tx_async(account_id, [transactions.create_transfer_action(amount)])
-
-    def function_call(self, contract_id, method_name, args, gas=DEFAULT_ATTACHED_GAS, amount=0) -> str:
-        """NEAR call method"""
-        args = json.dumps(args).encode('utf8')
-        return self._sign_and_submit_tx(contract_id,
-                                        [transactions.create_function_call_action(method_name, args, gas, amount)])
-    
-    def function_call_async(self, contract_id, method_name, args, gas=DEFAULT_ATTACHED_GAS, amount=0) -> str:
-        """NEAR call method"""
-        args = json.dumps(args).encode('utf8')
-        return self._sign_and_submit_tx_async(contract_id,
-                                        [transactions.create_function_call_action(method_name, args, gas, amount)])
-
-    def create_account(self, account_id, public_key, initial_balance) -> str:
-        actions = [
-            transactions.create_create_account_action(),
-            transactions.create_full_access_key_action(public_key),
-            transactions.create_transfer_action(initial_balance)]
-        return self._sign_and_submit_tx(account_id, actions)
-    
-    def create_account_async(self, account_id, public_key, initial_balance) -> str:
-        actions = [
-            transactions.create_create_account_action(),
-            transactions.create_full_access_key_action(public_key),
-            transactions.create_transfer_action(initial_balance)]
-        return self._sign_and_submit_tx_async(account_id, actions)
-
-    def delete_account(self, beneficiary_id: str) -> str:
-        return self._sign_and_submit_tx(self._account_id, [transactions.create_delete_account_action(beneficiary_id)])
-    
-    def delete_account_async(self, beneficiary_id: str) -> str:
-        return self._sign_and_submit_tx_async(self._account_id, [transactions.create_delete_account_action(beneficiary_id)])
-    
-    def create_full_access_key(self, public_key) -> str:
-        return self._sign_and_submit_tx(self._account_id, [transactions.create_full_access_key_action(public_key)])
-    
-    def create_full_access_key_async(self, public_key) -> str:
-        return self._sign_and_submit_tx_async(self._account_id, [transactions.create_full_access_key_action(public_key)])
-    
-    def delete_access_key(self, public_key) -> str:
-        return self._sign_and_submit_tx(self._account_id, [transactions.create_delete_access_key_action(public_key)])
-
-    def delete_access_key_async(self, public_key) -> str:
-        return self._sign_and_submit_tx_async(self._account_id, [transactions.create_delete_access_key_action(public_key)])
-
-    def deploy_contract(self, contract_code) -> str:
-        return self._sign_and_submit_tx(self._account_id, [transactions.create_deploy_contract_action(contract_code)])
-
-    def deploy_contract_async(self, contract_code) -> str:
-        return self._sign_and_submit_tx_async(self._account_id, [transactions.create_deploy_contract_action(contract_code)])
-
-    def deploy_and_init_contract(self, contract_code, args, gas=DEFAULT_ATTACHED_GAS, 
-                                 init_method_name="new") -> str:
-        args = json.dumps(args).encode('utf8')
-        actions = [     
-            near_api.transactions.create_deploy_contract_action(contract_code),
-            near_api.transactions.create_function_call_action(init_method_name, args, gas, 0)
-        ]
-        return self._sign_and_submit_tx(self._account_id, actions)
-
-    def deploy_and_init_contract_async(self, contract_code, args, gas=DEFAULT_ATTACHED_GAS, 
-                                 init_method_name="new") -> str:
-        args = json.dumps(args).encode('utf8')
-        actions = [     
-            near_api.transactions.create_deploy_contract_action(contract_code),
-            near_api.transactions.create_function_call_action(init_method_name, args, gas, 0)
-        ]
-        return self._sign_and_submit_tx_async(self._account_id, actions)
-    
-    def stake(self, public_key, amount) -> str:
-        return self._sign_and_submit_tx(self._account_id, [transactions.create_staking_action(public_key, amount)])
-
-    def stake_async(self, public_key, amount) -> str:
-        return self._sign_and_submit_tx_async(self._account_id, [transactions.create_staking_action(public_key, amount)])
-
-    def create_and_deploy_contract(self, contract_id, public_key, contract_code, initial_balance) -> str:
-        actions = [
-                      transactions.create_create_account_action(),
-                      transactions.create_transfer_action(initial_balance),
-                      transactions.create_deploy_contract_action(contract_code)
-                  ] + ([transactions.create_full_access_key_action(public_key)] if public_key is not None else [])
-        return self._sign_and_submit_tx(contract_id, actions)
-    
-    def create_and_deploy_contract_async(self, contract_id, public_key, contract_code, initial_balance) -> str:
-        actions = [
-                      transactions.create_create_account_action(),
-                      transactions.create_transfer_action(initial_balance),
-                      transactions.create_deploy_contract_action(contract_code)
-                  ] + ([transactions.create_full_access_key_action(public_key)] if public_key is not None else [])
-        return self._sign_and_submit_tx_async(contract_id, actions)
+        return self._submit(account_id, [transactions.create_transfer_action(amount)], wait_until=wait_until)
+
+    send_money_async = _async_variant(send_money)
+
+    def function_call(self, contract_id, method_name, args, gas=DEFAULT_ATTACHED_GAS, amount=0, *,
+                      wait_until: str = WaitUntil.EXECUTED_OPTIMISTIC):
+        """NEAR call method. args are JSON-encoded unless already given as bytes."""
+        args = _encode_args(args)
+        return self._submit(contract_id, [transactions.create_function_call_action(method_name, args, gas, amount)],
+                            wait_until=wait_until)
+
+    function_call_async = _async_variant(function_call)
+
+    def batch(self, receiver_id: str, wait_until: str = WaitUntil.EXECUTED_OPTIMISTIC) -> 'ActionBatch':
+        """Accumulates actions for receiver_id and sends them as a single transaction on exit."""
+        return ActionBatch(self, receiver_id, wait_until)
+
+    def create_account(self, account_id, public_key, initial_balance, *,
+                       wait_until: str = WaitUntil.EXECUTED_OPTIMISTIC):
+        with self.batch(account_id, wait_until) as batch:
+            batch.create_account()
+            batch.add_full_access_key(public_key)
+            batch.transfer(initial_balance)
+        return batch.result
+
+    create_account_async = _async_variant(create_account)
+
+    def delete_account(self, beneficiary_id: str, *, wait_until: str = WaitUntil.EXECUTED_OPTIMISTIC):
+        return self._submit(self._account_id, [transactions.create_delete_account_action(beneficiary_id)],
+                            wait_until=wait_until)
+
+    delete_account_async = _async_variant(delete_account)
+
+    def create_full_access_key(self, public_key, *, wait_until: str = WaitUntil.EXECUTED_OPTIMISTIC):
+        return self._submit(self._account_id, [transactions.create_full_access_key_action(public_key)],
+                            wait_until=wait_until)
+
+    create_full_access_key_async = _async_variant(create_full_access_key)
+
+    def delete_access_key(self, public_key, *, wait_until: str = WaitUntil.EXECUTED_OPTIMISTIC):
+        return self._submit(self._account_id, [transactions.create_delete_access_key_action(public_key)],
+                            wait_until=wait_until)
+
+    delete_access_key_async = _async_variant(delete_access_key)
+
+    def deploy_contract(self, contract_code, *, wait_until: str = WaitUntil.EXECUTED_OPTIMISTIC):
+        return self._submit(self._account_id, [transactions.create_deploy_contract_action(contract_code)],
+                            wait_until=wait_until)
+
+    deploy_contract_async = _async_variant(deploy_contract)
+
+    def deploy_and_init_contract(self, contract_code, args, gas=DEFAULT_ATTACHED_GAS, init_method_name="new", *,
+                                 wait_until: str = WaitUntil.EXECUTED_OPTIMISTIC):
+        with self.batch(self._account_id, wait_until) as batch:
+            batch.deploy(contract_code)
+            batch.function_call(init_method_name, args, gas, 0)
+        return batch.result
+
+    deploy_and_init_contract_async = _async_variant(deploy_and_init_contract)
+
+    def stake(self, public_key, amount, *, wait_until: str = WaitUntil.EXECUTED_OPTIMISTIC):
+        return self._submit(self._account_id, [transactions.create_staking_action(public_key, amount)],
+                            wait_until=wait_until)
+
+    stake_async = _async_variant(stake)
+
+    def create_and_deploy_contract(self, contract_id, public_key, contract_code, initial_balance, *,
+                                   wait_until: str = WaitUntil.EXECUTED_OPTIMISTIC):
+        with self.batch(contract_id, wait_until) as batch:
+            batch.create_account()
+            batch.transfer(initial_balance)
+            batch.deploy(contract_code)
+            if public_key is not None:
+                batch.add_full_access_key(public_key)
+        return batch.result
+
+    create_and_deploy_contract_async = _async_variant(create_and_deploy_contract)
 
     def create_deploy_and_init_contract(self, contract_id, public_key, contract_code, initial_balance, args,
-                                        gas=DEFAULT_ATTACHED_GAS, init_method_name="new") -> str:
-        args = json.dumps(args).encode('utf8')
-        actions = [
-                      transactions.create_create_account_action(),
-                      transactions.create_transfer_action(initial_balance),
-                      transactions.create_deploy_contract_action(contract_code),
-                      transactions.create_function_call_action(init_method_name, args, gas, 0)
-                  ] + ([transactions.create_full_access_key_action(public_key)] if public_key is not None else [])
-        return self._sign_and_submit_tx(contract_id, actions)
-
-    def create_deploy_and_init_contract_async(self, contract_id, public_key, contract_code, initial_balance, args,
-                                        gas=DEFAULT_ATTACHED_GAS, init_method_name="new") -> str:
-        args = json.dumps(args).encode('utf8')
-        actions = [
-                      transactions.create_create_account_action(),
-                      transactions.create_transfer_action(initial_balance),
-                      transactions.create_deploy_contract_action(contract_code),
-                      transactions.create_function_call_action(init_method_name, args, gas, 0)
-                  ] + ([transactions.create_full_access_key_action(public_key)] if public_key is not None else [])
-        return self._sign_and_submit_tx_async(contract_id, actions)
+                                        gas=DEFAULT_ATTACHED_GAS, init_method_name="new", *,
+                                        wait_until: str = WaitUntil.EXECUTED_OPTIMISTIC):
+        with self.batch(contract_id, wait_until) as batch:
+            batch.create_account()
+            batch.transfer(initial_balance)
+            batch.deploy(contract_code)
+            batch.function_call(init_method_name, args, gas, 0)
+            if public_key is not None:
+                batch.add_full_access_key(public_key)
+        return batch.result
+
+    create_deploy_and_init_contract_async = _async_variant(create_deploy_and_init_contract)
 
     def view_function(self, contract_id, method_name, args) -> dict:
-        """NEAR view method"""
-        result = self._provider.view_call(contract_id, method_name, json.dumps(args).encode('utf8'))
+        """NEAR view method. args are JSON-encoded unless already given as bytes."""
+        result = self._provider.view_call(contract_id, method_name, _encode_args(args))
         if "error" in result:
             raise ViewFunctionError(result["error"])
-        result["result"] = json.loads(''.join([chr(x) for x in result["result"]]))
+        result["result"] = _decode_result(bytes(result["result"]))
         return result
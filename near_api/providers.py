@@ -1,20 +1,61 @@
-import requests
+import httpx
 import base64
-import json
-from typing import Union, Tuple
+import msgspec
+import orjson
+from typing import List, Tuple, Union
 
 TimeoutType = Union[float, Tuple[float, float]]
 ''' The type used as "timeout" argument when sending requests. Quantities are in seconds.
 As a float, it indicates how long to wait for the server to send data,
 As a (connect timeout, read timeout) tuple, it specifically indicates how long to
 wait for the connection to establish and how long to wait for the sever to respond.
-See https://requests.readthedocs.io/en/latest/api/#requests.request
+See https://www.python-httpx.org/advanced/#timeout-configuration
 '''
 
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Idle connections kept open to the RPC node between calls.
+MAX_KEEPALIVE_CONNECTIONS = 32
+
+
+def _timeout(timeout: TimeoutType) -> httpx.Timeout:
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+def _rpc_content(r: httpx.Response):
+    '''Parses a JSON-RPC response body. nearcore sends errors such as TIMEOUT_ERROR with a
+    non-2xx status (408 for timeouts), so the body is checked before the HTTP status.'''
+    try:
+        content = orjson.loads(r.content)
+    except orjson.JSONDecodeError:
+        r.raise_for_status()
+        raise
+    if not (isinstance(content, dict) and "error" in content):
+        r.raise_for_status()
+    return content
+
 class FinalityTypes():
     FINAL = 'final'
     OPTIMISTIC = 'optimistic'
 
+class WaitUntil():
+    '''How far a submitted transaction has to progress before the call returns.'''
+    NONE = 'NONE'
+    INCLUDED = 'INCLUDED'
+    EXECUTED_OPTIMISTIC = 'EXECUTED_OPTIMISTIC'
+
+class SyncInfo(msgspec.Struct):
+    latest_block_hash: str
+
+class NodeStatus(msgspec.Struct):
+    '''The part of the node status response needed to sign transactions, other fields are skipped while decoding.'''
+    sync_info: SyncInfo
+
+_node_status_decoder = msgspec.json.Decoder(NodeStatus)
+
 class JsonProviderError(Exception):
     pass
 
@@ -25,10 +66,16 @@ class JsonProvider(object):
             self._rpc_addr = "http://%s:%s" % rpc_addr
         else:
             self._rpc_addr = rpc_addr
+        self._client = httpx.Client(
+            http2=True, limits=httpx.Limits(max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS))
 
     def rpc_addr(self) -> str:
         return self._rpc_addr
 
+    def close(self):
+        """Closes the pooled connections to the RPC node."""
+        self._client.close()
+
     def json_rpc(self, method: str, params, timeout: TimeoutType=30.0) -> dict:
         j = {
             'method': method,
@@ -36,26 +83,68 @@ class JsonProvider(object):
             'id': 'dontcare',
             'jsonrpc': '2.0'
         }
-        r = requests.post(self.rpc_addr(), json=j, timeout=timeout)
-        r.raise_for_status()
-        content = json.loads(r.content)
+        r = self._client.post(self.rpc_addr(), content=orjson.dumps(j), headers=JSON_HEADERS,
+                              timeout=_timeout(timeout))
+        content = _rpc_content(r)
         if "error" in content:
             raise JsonProviderError(content["error"])
         return content["result"]
 
+    def call_batch(self, calls: List[Tuple[str, object]], timeout: TimeoutType=30.0) -> list:
+        '''Sends several (method, params) calls in one JSON-RPC 2.0 batch request.
+        Only for RPC endpoints that accept batches: nearcore's own RPC server rejects them,
+        so nothing in this library relies on this method.
+        Results are returned in the same order as calls; a call that failed is returned
+        as a JsonProviderError instead of a result, so the other results are kept.'''
+        j = [
+            {
+                'method': method,
+                'params': params,
+                'id': i,
+                'jsonrpc': '2.0'
+            } for i, (method, params) in enumerate(calls)
+        ]
+        r = self._client.post(self.rpc_addr(), content=orjson.dumps(j), headers=JSON_HEADERS,
+                              timeout=_timeout(timeout))
+        content = _rpc_content(r)
+        if isinstance(content, dict):
+            # The endpoint rejected the batch as a whole.
+            raise JsonProviderError(content["error"])
+        results = [None] * len(calls)
+        for response in content:
+            if "error" in response:
+                results[response["id"]] = JsonProviderError(response["error"])
+            else:
+                results[response["id"]] = response["result"]
+        return results
+
     def send_tx(self, signed_tx: bytes, timeout: TimeoutType=30.0) -> dict:
         return self.json_rpc('broadcast_tx_async',
                              [base64.b64encode(signed_tx).decode('utf8')], timeout=timeout)
 
+    def send_tx_until(self, signed_tx: bytes, wait_until: str, timeout: TimeoutType=30.0) -> dict:
+        '''Sends a transaction and waits on the node until it reaches wait_until (see WaitUntil).
+        Validation errors such as InvalidNonce or Expired are returned right away.'''
+        return self.json_rpc('send_tx', {
+            'signed_tx_base64': base64.b64encode(signed_tx).decode('utf8'),
+            'wait_until': wait_until
+        }, timeout=timeout)
+
     def send_tx_and_wait(self, signed_tx: bytes, timeout: TimeoutType) -> dict:
         return self.json_rpc('broadcast_tx_commit',
                              [base64.b64encode(signed_tx).decode('utf8')],
                              timeout=timeout)
 
-    def get_status(self, timeout: TimeoutType=30.0) -> dict:
-        r = requests.get("%s/status" % self.rpc_addr(), timeout=timeout)
+    def _fetch_status(self, timeout: TimeoutType) -> bytes:
+        r = self._client.get("%s/status" % self.rpc_addr(), timeout=_timeout(timeout))
         r.raise_for_status()
-        return json.loads(r.content)
+        return r.content
+
+    def get_status(self, timeout: TimeoutType=30.0) -> dict:
+        return orjson.loads(self._fetch_status(timeout))
+
+    def get_latest_block_hash(self, timeout: TimeoutType=30.0) -> str:
+        return _node_status_decoder.decode(self._fetch_status(timeout)).sync_info.latest_block_hash
 
     def get_validators(self, timeout: TimeoutType=30.0) -> dict:
         return self.json_rpc('validators', [None], timeout=timeout)
@@ -107,6 +196,14 @@ class JsonProvider(object):
     def get_tx(self, tx_hash, tx_recipient_id, timeout: TimeoutType=30.0) -> dict:
         return self.json_rpc('tx', [tx_hash, tx_recipient_id], timeout=timeout)
 
+    def get_tx_status(self, tx_hash: str, sender_account_id: str, wait_until: str,
+                      timeout: TimeoutType=30.0) -> dict:
+        return self.json_rpc('tx', {
+            'tx_hash': tx_hash,
+            'sender_account_id': sender_account_id,
+            'wait_until': wait_until
+        }, timeout=timeout)
+
     def get_changes_in_block(self, block_id=None, finality:str=None, timeout: TimeoutType=30.0) -> dict:
         '''Use either block_id or finality. Choose finality from "finality_types" class'''
         params = {}
@@ -1,7 +1,8 @@
 import json
 
 import base58
-import ed25519
+import nacl.bindings
+import nacl.signing
 import json
 from typing import Union
 
@@ -13,32 +14,39 @@ class KeyPair(object):
         If no secret_key, a new one is created.
         secret_key must be a base58-encoded string or
         the byte object returned as "secret_key" property of a KeyPair object. 
+        Both the 64-byte (seed + public key) form and the bare 32-byte seed are accepted.
         '''
         if not secret_key:
-            self._secret_key, self._public_key = ed25519.keys.create_keypair()
-            return
-        if isinstance(secret_key, bytes):
-            self._secret_key = ed25519.keys.SigningKey(secret_key)
-        elif isinstance(secret_key, str):
-            secret_key = secret_key.split(':')[-1]
-            self._secret_key = ed25519.keys.SigningKey(base58.b58decode(secret_key))
+            self._secret_key = nacl.signing.SigningKey.generate()
         else:
-            raise Exception('Unrecognised')
-        self._public_key = self._secret_key.get_verifying_key()
+            if isinstance(secret_key, str):
+                secret_key = base58.b58decode(secret_key.split(':')[-1])
+            elif not isinstance(secret_key, bytes):
+                raise Exception('Unrecognised')
+            seed_size = nacl.bindings.crypto_sign_SEEDBYTES
+            if len(secret_key) not in (seed_size, nacl.bindings.crypto_sign_SECRETKEYBYTES):
+                raise ValueError('secret_key must be %d or %d bytes long, got %d' % (
+                    seed_size, nacl.bindings.crypto_sign_SECRETKEYBYTES, len(secret_key)))
+            self._secret_key = nacl.signing.SigningKey(secret_key[:seed_size])
+            if len(secret_key) > seed_size and secret_key[seed_size:] != bytes(self._secret_key.verify_key):
+                raise ValueError('secret_key public half does not match its seed')
+        # The public key is read for every signed transaction, so encode it once.
+        self._public_key = bytes(self._secret_key.verify_key)
+        self._encoded_public_key = base58.b58encode(self._public_key).decode('utf-8')
 
     @property
-    def public_key(self) -> str:
-        return self._public_key.to_bytes()
+    def public_key(self) -> bytes:
+        return self._public_key
 
-    def encoded_public_key(self):
-        return base58.b58encode(self.public_key).decode('utf-8')
+    def encoded_public_key(self) -> str:
+        return self._encoded_public_key
 
-    def sign(self, message: bytes) -> str:
-        return self._secret_key.sign(message)
+    def sign(self, message: bytes) -> bytes:
+        return self._secret_key.sign(message).signature
 
     @property
-    def secret_key(self):
-        return self._secret_key.to_bytes()
+    def secret_key(self) -> bytes:
+        return bytes(self._secret_key) + self._public_key
 
     @property
     def encoded_secret_key(self):
@@ -67,10 +75,13 @@ class Signer(object):
         return self._key_pair
 
     @property
-    def public_key(self) -> str:
+    def public_key(self) -> bytes:
         return self._key_pair.public_key
 
-    def sign(self, message: bytes) -> str:
+    def encoded_public_key(self) -> str:
+        return self._key_pair.encoded_public_key()
+
+    def sign(self, message: bytes) -> bytes:
         return self._key_pair.sign(message)
 
     @classmethod
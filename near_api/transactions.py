@@ -253,37 +253,73 @@ tx_schema = dict(
 )
 
 
-def sign_and_serialize_transaction(
+class TransactionTemplate:
+    '''
+    Pre-serialized parts of a transaction that stay the same for a given signer, receiver and block hash.
+    Borsh puts the nonce between them: head (signerId, publicKey) + nonce + tail (receiverId, blockHash) + actions.
+    '''
+
+    def __init__(self, head: bytes, tail: bytes):
+        self.head = head
+        self.tail = tail
+
+
+def build_template(
+        signer: 'near_api.signer.Signer',
         receiver_id: str,
+        block_hash
+) -> 'TransactionTemplate':
+    assert signer.public_key is not None    # TODO: Need to replace to Exception
+    assert block_hash is not None    # TODO: Need to replace to Exception
+    public_key = PublicKey()
+    public_key.keyType = 0
+    public_key.data = signer.public_key
+
+    head = BinarySerializer(tx_schema)
+    head.serialize_field(signer.account_id, 'string')
+    head.serialize_field(public_key, PublicKey)
+    tail = BinarySerializer(tx_schema)
+    tail.serialize_field(receiver_id, 'string')
+    tail.serialize_field(block_hash, [32])
+    return TransactionTemplate(bytes(head.array), bytes(tail.array))
+
+
+def sign_and_serialize_from_template(
+        template: 'TransactionTemplate',
         nonce,
         actions: list,
-        block_hash,
         signer: 'near_api.signer.Signer'
 ) -> bytes:
-    assert signer.public_key is not None    # TODO: Need to replace to Exception
-    assert block_hash is not None    # TODO: Need to replace to Exception
-    tx = Transaction()
-    tx.signerId = signer.account_id
-    tx.publicKey = PublicKey()
-    tx.publicKey.keyType = 0
-    tx.publicKey.data = signer.public_key
-    tx.nonce = nonce
-    tx.receiverId = receiver_id
-    tx.actions = actions
-    tx.blockHash = block_hash
-
-    msg = BinarySerializer(tx_schema).serialize(tx)
+    nonce_part = BinarySerializer(tx_schema)
+    nonce_part.serialize_num(nonce, 8)
+    actions_part = BinarySerializer(tx_schema)
+    actions_part.serialize_field(actions, [Action])
+
+    msg = b''.join((template.head, nonce_part.array, template.tail, actions_part.array))
     hash_ = hashlib.sha256(msg).digest()
 
     signature = Signature()
     signature.keyType = 0
     signature.data = signer.sign(hash_)
 
-    signed_tx = SignedTransaction()
-    signed_tx.transaction = tx
-    signed_tx.signature = signature
+    # A SignedTransaction is the serialized transaction directly followed by its signature.
+    return msg + BinarySerializer(tx_schema).serialize(signature)
+
 
-    return BinarySerializer(tx_schema).serialize(signed_tx)
+def signed_transaction_hash(signed_tx: bytes) -> bytes:
+    '''Hash of a transaction serialized by this module, i.e. sha256 of the part before the ed25519 signature.'''
+    signature_size = 1 + 64    # keyType + data
+    return hashlib.sha256(signed_tx[:-signature_size]).digest()
+
+
+def sign_and_serialize_transaction(
+        receiver_id: str,
+        nonce,
+        actions: list,
+        block_hash,
+        signer: 'near_api.signer.Signer'
+) -> bytes:
+    return sign_and_serialize_from_template(build_template(signer, receiver_id, block_hash), nonce, actions, signer)
 
 
 def create_create_account_action() -> 'Action':
@@ -11,7 +11,11 @@ META_DATA = dict(
 
     packages=find_packages(),
 
-    install_requires=["requests", "base58", "ed25519"]
+    python_requires=">=3.10",
+
+    install_requires=["httpx[http2]", "base58", "pynacl", "orjson", "msgspec"],
+
+    extras_require={"fast": ["based58"]}
 )
 
 if __name__ == "__main__":
@@ -1,9 +1,13 @@
+import struct
+import sys
+import threading
 import unittest
+from unittest import mock
 
 import near_api
 
 from config import NODE_URL
-from utils import create_account
+from utils import StubProvider, create_account, rpc_error
 
 
 class AccountTest(unittest.TestCase):
@@ -29,3 +33,193 @@ class AccountTest(unittest.TestCase):
         sender.send_money(receiver.account_id, 1000)
         receiver.fetch_state()
         self.assertEqual(int(receiver.state["amount"]), 10**24 + 1000)
+
+    def test_batch(self):
+        sender = create_account(self.master_account)
+        receiver = create_account(self.master_account)
+        with sender.batch(receiver.account_id) as batch:
+            batch.transfer(1000)
+            batch.transfer(2000)
+        self.assertEqual(len(batch.result['transaction']['actions']), 2)
+        receiver.fetch_state()
+        self.assertEqual(int(receiver.state["amount"]), 10**24 + 3000)
+
+
+class AccountOfflineTest(unittest.TestCase):
+    def setUp(self):
+        self.provider = StubProvider()
+        self.account = near_api.account.Account(
+            self.provider, near_api.signer.Signer("test.near", near_api.signer.KeyPair()), "test.near")
+
+    def test_async_variant(self):
+        self.assertEqual(self.account.send_money_async("receiver.near", 1), "tx_hash_1")
+        with self.assertRaises(TypeError):
+            self.account.send_money_async("receiver.near", 1, wait_until=near_api.providers.WaitUntil.INCLUDED)
+        self.assertEqual(len(self.provider.sent), 1)
+
+    def test_decode_result_keeps_wide_integers(self):
+        u128_max = 2 ** 128 - 1
+        self.assertEqual(near_api.account._decode_result(b'{"x": %d}' % u128_max), {"x": u128_max})
+        self.assertEqual(near_api.account._decode_result(b'{"x": 1, "y": "a"}'), {"x": 1, "y": "a"})
+
+    def test_submit_many(self):
+        actions_list = [[near_api.transactions.create_transfer_action(i)] for i in range(1, 4)]
+        self.assertEqual(self.account.submit_many("receiver.near", actions_list),
+                         ["tx_hash_1", "tx_hash_2", "tx_hash_3"])
+        self.provider.send_error_at = 4
+        with self.assertRaises(near_api.account.SubmitManyError) as cm:
+            self.account.submit_many("receiver.near", actions_list)
+        self.assertEqual(cm.exception.tx_hashes, ["tx_hash_4"])
+        self.assertEqual(self.account.reserve_nonce()[0], 7)
+
+    def test_send_money_returns_validation_error_without_polling(self):
+        self.provider.wait_responses = [rpc_error("INVALID_TRANSACTION", error="Expired")]
+        with self.assertRaises(near_api.providers.JsonProviderError):
+            self.account.send_money("receiver.near", 1)
+        self.assertNotIn('get_tx_status', self.provider.calls)
+
+    @mock.patch('near_api.account.time.sleep')
+    def test_send_money_polls_after_node_timeout(self, sleep):
+        outcome = {"status": {"SuccessValue": ""}, "transaction_outcome": {"outcome": {"logs": []}},
+                   "receipts_outcome": []}
+        self.provider.wait_responses = [rpc_error("TIMEOUT_ERROR"), rpc_error("TIMEOUT_ERROR"),
+                                        rpc_error("TIMEOUT_ERROR"), outcome]
+        self.assertIs(self.account.send_money("receiver.near", 1), outcome)
+        self.assertEqual(self.provider.calls.count('get_tx_status'), 3)
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [0.2, 0.4])
+
+    @mock.patch('near_api.account.time.sleep')
+    @mock.patch.object(near_api.account, 'TX_POLL_TIMEOUT', 0)
+    def test_send_money_gives_up_after_poll_timeout(self, sleep):
+        self.provider.wait_responses = [rpc_error("TIMEOUT_ERROR"), rpc_error("TIMEOUT_ERROR")]
+        with self.assertRaises(near_api.account.TransactionError):
+            self.account.send_money("receiver.near", 1)
+
+    def test_transaction_failure(self):
+        self.provider.wait_responses = [{"status": {"Failure": {"ActionError": {}}},
+                                         "transaction_outcome": {"outcome": {"logs": []}}, "receipts_outcome": []}]
+        with self.assertRaises(near_api.account.TransactionError):
+            self.account.send_money("receiver.near", 1)
+
+    def test_reserve_nonce_from_threads(self):
+        nonces = []
+
+        def reserve():
+            for _ in range(200):
+                nonces.extend(self.account.reserve_nonce(2))
+
+        threads = [threading.Thread(target=reserve) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(nonces), list(range(1, 8 * 200 * 2 + 1)))
+        self.assertEqual(self.account.access_key["nonce"], 8 * 200 * 2)
+        self.assertEqual(self.provider.calls.count('get_access_key'), 1)
+
+    def test_initial_nonce_skips_rpc(self):
+        account = near_api.account.Account(self.provider, self.account.signer, "test.near", initial_nonce=41)
+        self.assertEqual(account.reserve_nonce()[0], 42)
+        self.assertEqual(self.provider.calls, [])
+
+    def test_resync_after_invalid_nonce(self):
+        self.account.send_money("receiver.near", 1)
+        self.provider.nonce = 50
+        self.provider.wait_responses = [rpc_error("INVALID_TRANSACTION", error="InvalidNonce")]
+        with self.assertRaises(near_api.providers.JsonProviderError):
+            self.account.send_money("receiver.near", 1)
+        self.assertEqual(self.account.reserve_nonce()[0], 51)
+
+    def test_block_hash_ttl_and_invalidation(self):
+        clock = [100.0]
+        with mock.patch('near_api.account.time.monotonic', lambda: clock[0]):
+            self.account.send_money_async("receiver.near", 1)
+            clock[0] += near_api.account.BLOCK_HASH_TTL / 2
+            self.account.send_money_async("receiver.near", 1)
+            self.assertEqual(self.provider.calls.count('get_latest_block_hash'), 1)
+            clock[0] += near_api.account.BLOCK_HASH_TTL
+            self.account.send_money_async("receiver.near", 1)
+            self.assertEqual(self.provider.calls.count('get_latest_block_hash'), 2)
+
+            self.provider.wait_responses = [rpc_error("INVALID_TRANSACTION", error="Expired")]
+            with self.assertRaises(near_api.providers.JsonProviderError):
+                self.account.send_money("receiver.near", 1)
+            self.account.send_money_async("receiver.near", 1)
+            self.assertEqual(self.provider.calls.count('get_latest_block_hash'), 3)
+
+    def assertSentArgs(self, args):
+        # Borsh stores function call args as a u32 length followed by the raw bytes.
+        self.assertIn(struct.pack('<I', len(args)) + args, self.provider.sent[-1])
+
+    def test_function_call_args(self):
+        self.account.function_call("contract.near", "method", {"owner_id": "test.near"})
+        self.assertSentArgs(b'{"owner_id":"test.near"}')
+        self.account.function_call("contract.near", "method", b'\x00pre-encoded\xff')
+        self.assertSentArgs(b'\x00pre-encoded\xff')
+        self.account.function_call("contract.near", "method", {"amount": 2 ** 128 - 1})
+        self.assertSentArgs(b'{"amount": %d}' % (2 ** 128 - 1))
+
+    def test_batch_function_call_args(self):
+        with self.account.batch("contract.near") as batch:
+            batch.function_call("method", {"a": 1})
+            batch.function_call("method", bytearray(b'raw'))
+        self.assertSentArgs(b'{"a":1}')
+        self.assertSentArgs(b'raw')
+
+    def test_view_function(self):
+        result = self.account.view_function("contract.near", "method", {"a": 1})
+        self.assertEqual(self.provider.view_args, b'{"a":1}')
+        self.assertEqual(result["result"], {"total": "1000000000000000000000000", "count": 2 ** 128 - 1})
+        self.account.view_function("contract.near", "method", memoryview(b'raw'))
+        self.assertEqual(self.provider.view_args, b'raw')
+
+    def test_concurrent_submits_with_block_hash_invalidation(self):
+        errors = []
+        done = threading.Event()
+
+        def submit():
+            try:
+                for _ in range(200):
+                    self.account.send_money_async("receiver.near", 1)
+            except Exception as e:
+                errors.append(e)
+
+        def invalidate():
+            while not done.is_set():
+                self.account._on_tx_error("Expired")
+
+        # Switch threads as often as possible so the submitters interleave with the invalidation.
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, switch_interval)
+        invalidator = threading.Thread(target=invalidate)
+        invalidator.start()
+        threads = [threading.Thread(target=submit) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        done.set()
+        invalidator.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.provider.sent), 8 * 200)
+
+    def test_block_hash_invalidated_while_reading_cache(self):
+        self.account.send_money_async("receiver.near", 1)
+
+        def monotonic():
+            # Another submitter hitting an Expired error between reading and using the cache.
+            self.account._on_tx_error("Expired")
+            return 0.0
+
+        with mock.patch('near_api.account.time.monotonic', monotonic):
+            self.account.send_money_async("receiver.near", 1)
+        self.assertEqual(len(self.provider.sent), 2)
+
+    def test_state_is_fetched_lazily_and_separately(self):
+        account = near_api.account.Account(self.provider, self.account.signer, "test.near", initial_nonce=41)
+        self.assertEqual(account.state, {"amount": "0"})
+        self.assertEqual(account.state, {"amount": "0"})
+        self.assertEqual(self.provider.calls, ['get_account'])
+        self.account.reserve_nonce()
+        self.assertEqual(self.provider.calls, ['get_account', 'get_access_key'])
@@ -1,6 +1,10 @@
 import unittest
 import time
 
+import base58
+import httpx
+import orjson
+
 import near_api
 
 from config import NODE_URL
@@ -47,3 +51,43 @@ class JsonProviderTest(unittest.TestCase):
             'transaction', result['transaction']['hash'],
             result['transaction']['receiver_id'],
             next_light_client_block['prev_block_hash'])
+
+    def test_get_latest_block_hash(self):
+        latest_block_hash = self.provider.get_latest_block_hash()
+        self.assertEqual(len(base58.b58decode(latest_block_hash)), 32)
+
+
+class JsonProviderOfflineTest(unittest.TestCase):
+    def setUp(self):
+        self.provider = near_api.providers.JsonProvider("http://localhost:3030")
+
+    def mock_response(self, content, status_code=200):
+        self.provider._client = httpx.Client(transport=httpx.MockTransport(
+            lambda request: httpx.Response(status_code, content=orjson.dumps(content))))
+
+    def test_call_batch_keeps_results_around_errors(self):
+        self.mock_response([
+            {"jsonrpc": "2.0", "id": 1, "error": {"name": "HANDLER_ERROR"}},
+            {"jsonrpc": "2.0", "id": 0, "result": {"nonce": 5}},
+        ])
+        ok, failed = self.provider.call_batch([("query", {}), ("query", {})])
+        self.assertEqual(ok, {"nonce": 5})
+        self.assertIsInstance(failed, near_api.providers.JsonProviderError)
+
+    def test_call_batch_rejected(self):
+        self.mock_response({"jsonrpc": "2.0", "id": None, "error": {"name": "REQUEST_VALIDATION_ERROR"}})
+        with self.assertRaises(near_api.providers.JsonProviderError):
+            self.provider.call_batch([("status", [])])
+
+    def test_timeout_error_with_408(self):
+        self.mock_response({"jsonrpc": "2.0", "id": "dontcare", "error": {
+            "name": "HANDLER_ERROR", "cause": {"name": "TIMEOUT_ERROR"}, "code": -32000}}, status_code=408)
+        with self.assertRaises(near_api.providers.JsonProviderError) as cm:
+            self.provider.send_tx_until(b"tx", near_api.providers.WaitUntil.EXECUTED_OPTIMISTIC)
+        self.assertIn("TIMEOUT_ERROR", str(cm.exception))
+
+    def test_http_error_without_rpc_body(self):
+        self.provider._client = httpx.Client(transport=httpx.MockTransport(
+            lambda request: httpx.Response(502, content=b"Bad Gateway")))
+        with self.assertRaises(httpx.HTTPStatusError):
+            self.provider.get_block("final")
@@ -0,0 +1,35 @@
+import unittest
+
+import nacl.signing
+
+import near_api
+
+SECRET_KEY = "ed25519:2wyRcSwSuHtRVmkMCGjPwnzZmQLeXLzLLyED1NDMt4BjnKgQL6tF85yBx6Jr26D2dUNeC716RBoTxntVHsegogYw"
+
+
+class KeyPairTest(unittest.TestCase):
+    def test_secret_key_round_trip(self):
+        key_pair = near_api.signer.KeyPair(SECRET_KEY)
+        self.assertEqual(len(key_pair.secret_key), 64)
+        self.assertEqual(key_pair.encoded_secret_key, SECRET_KEY.split(':')[-1])
+        restored = near_api.signer.KeyPair(key_pair.secret_key)
+        self.assertEqual(restored.public_key, key_pair.public_key)
+
+    def test_sign(self):
+        key_pair = near_api.signer.KeyPair()
+        signature = key_pair.sign(b"message")
+        self.assertEqual(len(signature), 64)
+        nacl.signing.VerifyKey(key_pair.public_key).verify(b"message", signature)
+
+    def test_rejects_malformed_secret_key(self):
+        secret_key = near_api.signer.KeyPair(SECRET_KEY).secret_key
+        for malformed in (secret_key[:31], secret_key + b"\0", secret_key[:32] + bytes(32)):
+            with self.assertRaises(ValueError):
+                near_api.signer.KeyPair(malformed)
+        near_api.signer.KeyPair(secret_key[:32])
+
+    def test_signer_public_key(self):
+        key_pair = near_api.signer.KeyPair(SECRET_KEY)
+        signer = near_api.signer.Signer("test.near", key_pair)
+        self.assertIsInstance(signer.public_key, bytes)
+        self.assertEqual(signer.encoded_public_key(), key_pair.encoded_public_key())
@@ -0,0 +1,51 @@
+import hashlib
+import unittest
+
+import near_api
+from near_api.serializer import BinarySerializer
+from near_api.transactions import PublicKey, Signature, SignedTransaction, Transaction, tx_schema
+
+
+class TransactionTemplateTest(unittest.TestCase):
+    def setUp(self):
+        self.signer = near_api.signer.Signer("test.near", near_api.signer.KeyPair())
+        self.block_hash = bytes(range(32))
+        self.actions = [
+            near_api.transactions.create_transfer_action(10 ** 24),
+            near_api.transactions.create_function_call_action("new", b'{"a":1}', 10 ** 14, 0),
+        ]
+
+    def build_transaction(self, nonce):
+        tx = Transaction()
+        tx.signerId = self.signer.account_id
+        tx.publicKey = PublicKey()
+        tx.publicKey.keyType = 0
+        tx.publicKey.data = self.signer.public_key
+        tx.nonce = nonce
+        tx.receiverId = "receiver.near"
+        tx.actions = self.actions
+        tx.blockHash = self.block_hash
+        return tx
+
+    def serialize_struct(self, nonce):
+        tx = self.build_transaction(nonce)
+        signature = Signature()
+        signature.keyType = 0
+        signature.data = self.signer.sign(hashlib.sha256(BinarySerializer(tx_schema).serialize(tx)).digest())
+        signed_tx = SignedTransaction()
+        signed_tx.transaction = tx
+        signed_tx.signature = signature
+        return BinarySerializer(tx_schema).serialize(signed_tx)
+
+    def test_template_matches_full_serialization(self):
+        template = near_api.transactions.build_template(self.signer, "receiver.near", self.block_hash)
+        for nonce in (1, 2 ** 40):
+            self.assertEqual(
+                near_api.transactions.sign_and_serialize_from_template(template, nonce, self.actions, self.signer),
+                self.serialize_struct(nonce))
+
+    def test_signed_transaction_hash(self):
+        signed_tx = near_api.transactions.sign_and_serialize_transaction(
+            "receiver.near", 7, self.actions, self.block_hash, self.signer)
+        self.assertEqual(near_api.transactions.signed_transaction_hash(signed_tx),
+                         hashlib.sha256(BinarySerializer(tx_schema).serialize(self.build_transaction(7))).digest())
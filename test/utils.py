@@ -10,3 +10,66 @@ def create_account(master_account, amount=10 ** 24):
     account = near_api.account.Account(master_account.provider, signer,
                                        account_id)
     return account
+
+
+class StubProvider(object):
+    """Offline stand-in for JsonProvider that records calls and returns canned responses."""
+
+    def __init__(self, nonce=0):
+        self.calls = []
+        self.nonce = nonce
+        self.block_hashes = ("11111111111111111111111111111111", "4vJ9JU1bJJE96FWSJKvHsmmFADCg4gpZQff4P3bkLKi")
+        self.sent = []
+        # Index of the send_tx call that fails, and the error it fails with.
+        self.send_error_at = None
+        self.send_error = {"name": "HANDLER_ERROR", "cause": {"name": "INVALID_TRANSACTION"}}
+        # Results (or JsonProviderErrors to raise) for send_tx_until and get_tx_status, in call order.
+        self.wait_responses = []
+
+    def get_account(self, account_id):
+        self.calls.append('get_account')
+        return {"amount": "0"}
+
+    def get_access_key(self, account_id, public_key):
+        self.calls.append('get_access_key')
+        return {"nonce": self.nonce}
+
+    def get_latest_block_hash(self):
+        self.calls.append('get_latest_block_hash')
+        return self.block_hashes[self.calls.count('get_latest_block_hash') % 2]
+
+    def send_tx(self, signed_tx):
+        self.calls.append('send_tx')
+        if self.send_error_at == len(self.sent):
+            raise near_api.providers.JsonProviderError(self.send_error)
+        self.sent.append(signed_tx)
+        return "tx_hash_%d" % len(self.sent)
+
+    def view_call(self, account_id, method_name, args):
+        self.calls.append('view_call')
+        self.view_args = args
+        return {"result": list(b'{"total": "1000000000000000000000000", "count": 340282366920938463463374607431768211455}')}
+
+    def _next_wait_response(self):
+        response = self.wait_responses.pop(0) if self.wait_responses else {
+            "final_execution_status": "EXECUTED_OPTIMISTIC",
+            "status": {"SuccessValue": ""},
+            "transaction_outcome": {"outcome": {"logs": []}},
+            "receipts_outcome": [],
+        }
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def send_tx_until(self, signed_tx, wait_until):
+        self.calls.append('send_tx_until')
+        self.sent.append(signed_tx)
+        return self._next_wait_response()
+
+    def get_tx_status(self, tx_hash, sender_account_id, wait_until):
+        self.calls.append('get_tx_status')
+        return self._next_wait_response()
+
+
+def rpc_error(cause, **info):
+    return near_api.providers.JsonProviderError({"name": "HANDLER_ERROR", "cause": {"name": cause, "info": info}})